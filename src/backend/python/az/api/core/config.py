@@ -1,44 +1,125 @@
+import json
 import os
-from functools import lru_cache
+from dataclasses import dataclass, field, fields
 from typing import Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
 
+def _read_env_file(path: str = ".env") -> dict[str, str]:
+    """Read KEY=VALUE pairs from a dotenv file, if present."""
+    values: dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as env_file:
+            for line in env_file:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
 
-class Settings(BaseSettings):
+                key, value = line.split("=", 1)
+                key = key.strip()
+                if key.startswith("export "):
+                    key = key[len("export "):].strip()
+
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                elif " #" in value:
+                    value = value.split(" #", 1)[0].rstrip()
+
+                values[key.lower()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def _parse_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _parse_list(value: str) -> list[str]:
+    value = value.strip()
+    if value.startswith("["):
+        parsed = json.loads(value)
+        if not isinstance(parsed, list):
+            raise ValueError(f"Invalid list value: {value!r}")
+        return [str(item) for item in parsed]
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+_PARSERS = {
+    int: int,
+    bool: _parse_bool,
+    list[str]: _parse_list,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class Settings:
     """Application settings loaded from environment variables."""
-    
+
     # Server configuration
     app_name: str = "Azure Resource Management API"
     version: str = "1.0.0"
-    host: str = Field(default="0.0.0.0", description="Host to bind the server")
-    port: int = Field(default=8000, description="Port to bind the server")
-    debug: bool = Field(default=False, description="Enable debug mode")
-    
+    host: str = "0.0.0.0"  # Host to bind the server
+    port: int = 8000  # Port to bind the server
+    debug: bool = False  # Enable debug mode
+    workers: int = 0  # Worker processes when run via main.py (0 = WEB_CONCURRENCY or 1)
+    threadpool_size: int = 50  # Worker threads for blocking Azure SDK calls, per process
+
     # Azure configuration
-    azure_subscription_id: str = Field(..., description="Azure subscription ID")
-    azure_tenant_id: Optional[str] = Field(default=None, description="Azure tenant ID")
-    azure_client_id: Optional[str] = Field(default=None, description="Azure client ID")
-    azure_client_secret: Optional[str] = Field(default=None, description="Azure client secret")
-    
+    azure_subscription_id: str  # Azure subscription ID (required)
+    azure_tenant_id: Optional[str] = None
+    azure_client_id: Optional[str] = None
+    azure_client_secret: Optional[str] = None
+    azure_http_pool_size: int = 50  # Max pooled HTTPS connections shared by the Azure clients
+    azure_cache_ttl: int = 30  # Seconds to cache read-only lookups (0 disables)
+    azure_retry_total: int = 3  # Retries for throttled or transient Azure failures
+
     # API configuration
     api_v1_prefix: str = "/api/v1"
-    cors_origins: list[str] = Field(default=["*"], description="CORS allowed origins")
-    
+    cors_origins: list[str] = field(default_factory=lambda: ["*"])  # CORS allowed origins
+
     # Logging configuration
-    log_level: str = Field(default="INFO", description="Logging level")
-    log_format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Log format"
-    )
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-
-
-@lru_cache()
+    log_level: str = "INFO"
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """Build settings from the process environment, falling back to the env file.
+
+        Variable names are case-insensitive and environment variables take
+        precedence over values from the env file.
+        """
+        raw = _read_env_file(env_file)
+        raw.update((key.lower(), value) for key, value in os.environ.items())
+
+        values = {}
+        for settings_field in fields(cls):
+            if settings_field.name not in raw:
+                continue
+            value = raw[settings_field.name]
+            parser = _PARSERS.get(settings_field.type)
+            try:
+                values[settings_field.name] = parser(value) if parser else value
+            except ValueError as e:
+                raise ValueError(f"Invalid value for setting '{settings_field.name}': {e}") from e
+
+        if not values.get("azure_subscription_id"):
+            raise ValueError("Missing required setting: AZURE_SUBSCRIPTION_ID")
+
+        return cls(**values)
+
+
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
\ No newline at end of file
+    global _settings
+    if _settings is None:
+        _settings = Settings.from_env()
+    return _settings
@@ -0,0 +1,15 @@
+import hashlib
+
+
+def make_etag(content: bytes) -> str:
+    """Build a strong ETag from a response body."""
+    return '"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
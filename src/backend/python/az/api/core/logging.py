@@ -1,6 +1,11 @@
+import atexit
+import itertools
+import json
 import logging
+import logging.handlers
+import queue
+import secrets
 import sys
-import uuid
 from contextvars import ContextVar
 from typing import Optional
 
@@ -9,33 +14,87 @@ from api.core.config import get_settings
 # Context variable to store correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Log line format shared by all handlers
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] - %(message)s"
 
-class CorrelationFilter(logging.Filter):
-    """Add correlation ID to log records."""
-    
-    def filter(self, record):
+# Request context passed via extra=, appended to the line as key=value pairs
+CONTEXT_FIELDS = ("method", "path", "status", "elapsed_ms", "error")
+
+# Per-process prefix and counter used to mint correlation IDs
+_correlation_prefix = secrets.token_hex(2)
+_correlation_counter = itertools.count()
+
+
+def _install_correlation_record_factory():
+    """Attach the correlation ID to log records when they are created.
+
+    Records are only created for calls that pass the logger level check, so
+    the ContextVar lookup is skipped entirely for filtered-out log calls.
+    """
+    base_factory = logging.getLogRecordFactory()
+    if getattr(base_factory, "_adds_correlation_id", False):
+        return
+
+    def factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
         record.correlation_id = correlation_id.get() or "no-correlation-id"
-        return True
+        return record
+
+    factory._adds_correlation_id = True
+    logging.setLogRecordFactory(factory)
+
+
+def _logfmt_value(value) -> str:
+    if isinstance(value, float):
+        return "%.3f" % value
+    text = str(value)
+    if not text or any(c in text for c in ' "=\n'):
+        return json.dumps(text)
+    return text
+
+
+class ContextFormatter(logging.Formatter):
+    """Formatter that appends the CONTEXT_FIELDS a record carries as key=value pairs.
+
+    Log calls keep a constant message and pass request context through
+    extra=, so the fields are only stringified for records that get emitted
+    and stay machine-parseable for log ingestion.
+    """
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        context = " ".join(
+            "%s=%s" % (name, _logfmt_value(getattr(record, name)))
+            for name in CONTEXT_FIELDS
+            if hasattr(record, name)
+        )
+        return "%s %s" % (message, context) if context else message
 
 
 def setup_logging():
     """Setup application logging configuration."""
     settings = get_settings()
+    log_level = logging.getLevelName(settings.log_level.upper())
     
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] - %(message)s"
-    )
+    # Create formatter; every record carries correlation_id via the record factory
+    formatter = ContextFormatter(LOG_FORMAT, validate=False)
     
     # Setup handler
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
-    handler.addFilter(CorrelationFilter())
+    _install_correlation_record_factory()
+    
+    # Hand records to a background thread so stdout writes never block the event loop
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
     
     # Setup root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
-    root_logger.addHandler(handler)
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(queue_handler)
     
     # Setup specific loggers
     logging.getLogger("uvicorn.access").handlers = []
@@ -49,4 +108,4 @@ def get_logger(name: str) -> logging.Logger:
 
 def generate_correlation_id() -> str:
     """Generate a new correlation ID."""
-    return str(uuid.uuid4())[:8]
\ No newline at end of file
+    return f"{_correlation_prefix}{next(_correlation_counter) & 0xFFFF:04x}"
\ No newline at end of file
@@ -0,0 +1,75 @@
+import zlib
+from typing import AsyncIterator, List, Sequence
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Same level as the GZipMiddleware in main.py
+_GZIP_LEVEL = 5
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check whether the client asked for newline-delimited JSON."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "")
+
+
+async def _gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream, flushing after every chunk so each one reaches the client immediately."""
+    compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def stream_response(request: Request, chunks: AsyncIterator[bytes], media_type: str) -> StreamingResponse:
+    """Stream chunks to the client, gzip-compressed when the client accepts it.
+
+    GZipMiddleware only flushes its compressor at the end of the body, which
+    would hold back a streamed list until the last Azure page arrives. This
+    compresses with a sync flush per chunk instead, and the middleware leaves
+    responses that already carry a Content-Encoding alone.
+    """
+    if not _accepts_gzip(request):
+        return StreamingResponse(chunks, media_type=media_type)
+
+    return StreamingResponse(
+        _gzip_chunks(chunks),
+        media_type=media_type,
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+    )
+
+
+async def _ndjson_lines(
+    first_page: Sequence[BaseModel],
+    pages: AsyncIterator[List[BaseModel]]
+) -> AsyncIterator[bytes]:
+    """Serialize model pages as one JSON object per line."""
+    page = first_page
+    while True:
+        if page:
+            yield b"".join(model.model_dump_json().encode() + b"\n" for model in page)
+        try:
+            page = await pages.__anext__()
+        except StopAsyncIteration:
+            return
+
+
+async def ndjson_response(request: Request, pages: AsyncIterator[List[BaseModel]]) -> StreamingResponse:
+    """Stream model pages as NDJSON as soon as each page arrives.
+
+    The first page is fetched before the response starts so that a failing
+    Azure call can still be reported with an error status.
+    """
+    try:
+        first_page = await pages.__anext__()
+    except StopAsyncIteration:
+        first_page = []
+
+    return stream_response(request, _ndjson_lines(first_page, pages), NDJSON_MEDIA_TYPE)
@@ -1,53 +1,103 @@
+import logging
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from api.core.logging import correlation_id, generate_correlation_id, get_logger
 
 logger = get_logger(__name__)
 
+# Header names as raw ASGI bytes (ASGI header names are always lowercase)
+_HEADER_CORRELATION_ID = b"x-correlation-id"
+_HEADER_PROCESS_TIME = b"x-process-time"
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle request correlation IDs and logging."""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+# High-frequency probe endpoints that bypass correlation tracking and request logs
+_SKIP_PATHS = frozenset({"/health"})
+
+
+class CorrelationMiddleware:
+    """Pure ASGI middleware to handle request correlation IDs and logging."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with correlation ID and logging."""
-        
-        # Generate or extract correlation ID
-        corr_id = request.headers.get("X-Correlation-ID") or generate_correlation_id()
-        correlation_id.set(corr_id)
-        
-        # Log request start
-        start_time = time.time()
-        logger.info(f"Request started: {request.method} {request.url.path}")
-        
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Generate or extract correlation ID without building a Request object
+        corr_id_bytes = next(
+            (value for key, value in scope["headers"] if key == _HEADER_CORRELATION_ID),
+            None
+        )
+        if corr_id_bytes:
+            corr_id = corr_id_bytes.decode("latin-1")
+        else:
+            corr_id = generate_correlation_id()
+            corr_id_bytes = corr_id.encode("latin-1")
+        token = correlation_id.set(corr_id)
+
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+
+        # Log request start only when debugging; the completion line carries the same fields
+        start_time = time.perf_counter()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("request_started", extra={"method": method, "path": path})
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+                # Add correlation ID and processing time to response headers
+                process_time = time.perf_counter() - start_time
+                headers = list(message.get("headers", []))
+                headers.append((_HEADER_CORRELATION_ID, corr_id_bytes))
+                headers.append((_HEADER_PROCESS_TIME, b"%.6f" % process_time))
+                message["headers"] = headers
+            await send(message)
+
         try:
             # Process request
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = corr_id
-            response.headers["X-Process-Time"] = str(process_time)
-            
+            await self.app(scope, receive, send_wrapper)
+
             # Log response
+            process_time = time.perf_counter() - start_time
             logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Time: {process_time:.3f}s"
+                "request_completed",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "status": status_code,
+                    "elapsed_ms": process_time * 1000
+                }
             )
-            
-            return response
-            
+
         except Exception as e:
             # Calculate processing time for errors too
-            process_time = time.time() - start_time
-            
+            process_time = time.perf_counter() - start_time
+
             logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"- Error: {str(e)} - Time: {process_time:.3f}s"
+                "request_failed",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "status": 500,
+                    "elapsed_ms": process_time * 1000,
+                    "error": e
+                }
             )
-            raise
\ No newline at end of file
+            # The outer server error handler runs after the reset below, so hand
+            # it the correlation ID on the exception itself
+            if getattr(e, "correlation_id", None) is None:
+                e.correlation_id = corr_id
+            raise
+
+        finally:
+            # Always restore the previous value so the ID cannot leak into
+            # another request served from the same context or worker thread
+            correlation_id.reset(token)
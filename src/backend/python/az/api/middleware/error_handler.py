@@ -1,89 +1,160 @@
-from fastapi import Request
-from fastapi.responses import JSONResponse
+import time
+from typing import Any, Optional
+
+from azure.core.exceptions import (
+    AzureError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceResponseError,
+    ServiceResponseTimeoutError
+)
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from api.core.exceptions import AzureAPIException
 from api.core.logging import get_logger, correlation_id
-from api.models.resource_group import ErrorResponse, ErrorDetail
 
 logger = get_logger(__name__)
 
+# Azure SDK exception types mapped to the HTTP status reported to clients.
+# Subclasses (e.g. ServiceRequestTimeoutError) resolve through their MRO.
+_AZURE_ERROR_STATUS = {
+    ResourceNotFoundError: status.HTTP_404_NOT_FOUND,
+    ResourceExistsError: status.HTTP_409_CONFLICT,
+    ServiceRequestError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    ServiceResponseError: status.HTTP_502_BAD_GATEWAY,
+    ServiceResponseTimeoutError: status.HTTP_504_GATEWAY_TIMEOUT,
+}
+_PASSTHROUGH_STATUS = frozenset({
+    status.HTTP_400_BAD_REQUEST,
+    status.HTTP_404_NOT_FOUND,
+    status.HTTP_409_CONFLICT,
+})
+
+
+def _azure_error_status(exc: AzureError) -> int:
+    """Resolve the HTTP status for an Azure failure, matching the message only as a last resort."""
+    # The exact type is the first MRO entry, so the common case is a single lookup
+    for exc_type in type(exc).__mro__:
+        status_code = _AZURE_ERROR_STATUS.get(exc_type)
+        if status_code is not None:
+            return status_code
+    
+    if isinstance(exc, HttpResponseError) and exc.status_code in _PASSTHROUGH_STATUS:
+        return exc.status_code
+    
+    error_msg = str(exc).lower()
+    if "not found" in error_msg:
+        return status.HTTP_404_NOT_FOUND
+    if "already exists" in error_msg or "conflict" in error_msg:
+        return status.HTTP_409_CONFLICT
+    if "invalid" in error_msg or "bad request" in error_msg:
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
 
-async def azure_exception_handler(request: Request, exc: AzureAPIException) -> JSONResponse:
+def _error_content(
+    error: str,
+    message: Any,
+    correlation: Optional[str],
+    details: Optional[list[dict]] = None
+) -> dict:
+    """Build an ErrorResponse-shaped payload without a Pydantic round-trip."""
+    return {
+        "error": error,
+        "message": message,
+        "details": details,
+        "correlation_id": correlation or "unknown",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    }
+
+
+async def azure_exception_handler(request: Request, exc: AzureAPIException) -> ORJSONResponse:
     """Handle Azure API specific exceptions."""
     
-    logger.warning(f"Azure API exception: {exc.detail}")
+    logger.warning("azure_api_exception", extra={"status": exc.status_code, "error": exc.detail})
+    
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content=_error_content(
+            exc.__class__.__name__,
+            exc.detail,
+            exc.correlation_id or correlation_id.get()
+        )
+    )
+
+
+async def azure_sdk_exception_handler(request: Request, exc: AzureError) -> ORJSONResponse:
+    """Handle Azure SDK errors that escape a route, mapping them to an HTTP status."""
     
-    error_response = ErrorResponse(
-        error=exc.__class__.__name__,
-        message=exc.detail,
-        correlation_id=exc.correlation_id or correlation_id.get() or "unknown"
+    status_code = _azure_error_status(exc)
+    logger.error(
+        "azure_sdk_error",
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status": status_code,
+            "error": exc
+        }
     )
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump()
+    return ORJSONResponse(
+        status_code=status_code,
+        content=_error_content(exc.__class__.__name__, exc.message, correlation_id.get())
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle request validation errors."""
     
-    logger.warning(f"Validation error: {exc.errors()}")
+    logger.warning("validation_error", extra={"status": 422, "error": exc})
     
     # Convert validation errors to our format
     error_details = [
-        ErrorDetail(
-            field=".".join(str(loc) for loc in error["loc"]),
-            message=error["msg"],
-            code=error["type"]
-        )
+        {
+            "field": ".".join(str(loc) for loc in error["loc"]),
+            "message": error["msg"],
+            "code": error["type"]
+        }
         for error in exc.errors()
     ]
     
-    error_response = ErrorResponse(
-        error="ValidationError",
-        message="Request validation failed",
-        details=error_details,
-        correlation_id=correlation_id.get() or "unknown"
-    )
-    
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
-        content=error_response.model_dump()
+        content=_error_content(
+            "ValidationError",
+            "Request validation failed",
+            correlation_id.get(),
+            details=error_details
+        )
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """Handle general HTTP exceptions."""
     
-    logger.warning(f"HTTP exception: {exc.detail}")
-    
-    error_response = ErrorResponse(
-        error="HTTPException",
-        message=exc.detail,
-        correlation_id=correlation_id.get() or "unknown"
-    )
+    logger.warning("http_exception", extra={"status": exc.status_code, "error": exc.detail})
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        content=_error_content("HTTPException", exc.detail, correlation_id.get())
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions."""
     
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
+    logger.error("unexpected_error", exc_info=True, extra={"status": 500, "error": exc})
     
-    error_response = ErrorResponse(
-        error="InternalServerError",
-        message="An unexpected error occurred",
-        correlation_id=correlation_id.get() or "unknown"
-    )
-    
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=error_response.model_dump()
+        content=_error_content(
+            "InternalServerError",
+            "An unexpected error occurred",
+            getattr(exc, "correlation_id", None) or correlation_id.get()
+        )
     )
\ No newline at end of file
@@ -1,7 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
 class ResourceGroupBase(BaseModel):
@@ -27,8 +32,7 @@ class ResourceGroup(ResourceGroupBase):
     type: str = Field(default="Microsoft.Resources/resourceGroups", description="Resource type")
     managed_by: Optional[str] = Field(default=None, description="Resource manager")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ResourceGroupList(BaseModel):
@@ -39,8 +43,10 @@ class ResourceGroupList(BaseModel):
 
 class HealthCheck(BaseModel):
     """Health check response model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     status: str = Field(default="healthy", description="Service status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Check timestamp")
     version: str = Field(..., description="API version")
     azure_connection: bool = Field(..., description="Azure connectivity status")
 
@@ -54,11 +60,13 @@ class ErrorDetail(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Human-readable error message")
     details: Optional[list[ErrorDetail]] = Field(default=None, description="Error details")
     correlation_id: str = Field(..., description="Request correlation ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Error timestamp")
 
 
 # Storage Account Models
@@ -73,7 +81,13 @@ class StorageEndpoints(BaseModel):
 
 class StorageAccountBase(BaseModel):
     """Base storage account model."""
-    name: str = Field(..., min_length=3, max_length=24, description="Storage account name")
+    name: str = Field(
+        ...,
+        min_length=3,
+        max_length=24,
+        pattern=r"^[a-z0-9]+$",
+        description="Storage account name (lowercase letters and numbers only)"
+    )
     resource_group: str = Field(..., description="Resource group name")
     location: str = Field(..., description="Azure location/region")
     kind: Optional[str] = Field(default="StorageV2", description="Storage account kind")
@@ -104,8 +118,7 @@ class StorageAccount(StorageAccountBase):
     creation_time: Optional[datetime] = Field(default=None, description="Creation timestamp")
     primary_endpoints: Optional[StorageEndpoints] = Field(default=None, description="Primary endpoints")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StorageAccountList(BaseModel):
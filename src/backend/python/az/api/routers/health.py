@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends
 from api.core.config import Settings, get_settings
 from api.core.logging import get_logger
 from api.models.resource_group import HealthCheck
-from api.services.azure_service import AzureService
+from api.services.azure_service import get_azure_service
 
 router = APIRouter(tags=["health"])
 logger = get_logger(__name__)
@@ -21,10 +21,10 @@ async def health_check(settings: Settings = Depends(get_settings)) -> HealthChec
     
     try:
         # Test Azure connection
-        azure_service = AzureService(settings)
+        azure_service = get_azure_service()
         azure_connection = await azure_service.test_connection()
         
-        logger.info(f"Health check completed - Azure connection: {azure_connection}")
+        logger.info("Health check completed - Azure connection: %s", azure_connection)
         
         return HealthCheck(
             status="healthy" if azure_connection else "degraded",
@@ -33,7 +33,7 @@ async def health_check(settings: Settings = Depends(get_settings)) -> HealthChec
         )
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return HealthCheck(
             status="unhealthy",
             version=settings.version,
@@ -1,53 +1,87 @@
-from typing import List
+from typing import AsyncIterator, List
 
-from azure.core.exceptions import ResourceNotFoundError as AzureResourceNotFoundError
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
-from api.core.config import Settings, get_settings
-from api.core.exceptions import ResourceNotFoundError, AzureConnectionError
-from api.core.logging import get_logger, correlation_id
+from api.core.logging import get_logger
+from api.core.streaming import NDJSON_MEDIA_TYPE, ndjson_response, stream_response, wants_ndjson
 from api.models.resource_group import (
     ResourceGroup,
     ResourceGroupCreate,
     ResourceGroupUpdate,
     ResourceGroupList
 )
-from api.services.azure_service import AzureService
+from api.services.azure_service import AzureService, get_azure_service
 
 router = APIRouter(prefix="/resource-groups", tags=["resource groups"])
 logger = get_logger(__name__)
 
 
-def get_azure_service(settings: Settings = Depends(get_settings)) -> AzureService:
-    """Dependency to get Azure service instance."""
-    return AzureService(settings)
+async def _stream_resource_group_list(
+    first_page: List[ResourceGroup],
+    pages: AsyncIterator[List[ResourceGroup]]
+) -> AsyncIterator[bytes]:
+    """Serialize resource group pages as a ResourceGroupList JSON document."""
+    yield b'{"resource_groups":['
+    
+    count = 0
+    page = first_page
+    while True:
+        if page:
+            chunk = b",".join(rg.model_dump_json().encode() for rg in page)
+            yield b"," + chunk if count else chunk
+            count += len(page)
+        try:
+            page = await pages.__anext__()
+        except StopAsyncIteration:
+            break
+        except Exception as e:
+            # Headers are already sent, so the only option is to abort the body
+            logger.error("Failed to list resource groups after %s items: %s", count, e)
+            raise
+    
+    yield b'],"count":%d}' % count
 
 
-@router.get("/", response_model=ResourceGroupList, summary="List all resource groups")
+@router.get(
+    "/",
+    response_model=ResourceGroupList,
+    summary="List all resource groups",
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "Resource groups, or NDJSON when requested"}
+    }
+)
 async def list_resource_groups(
+    request: Request,
     azure_service: AzureService = Depends(get_azure_service)
-) -> ResourceGroupList:
+) -> StreamingResponse:
     """
     List all resource groups in the subscription.
     
+    The response is streamed page by page as Azure returns them. Clients
+    sending ``Accept: application/x-ndjson`` get one resource group per line
+    instead of a single ResourceGroupList document.
+    
     Returns:
         ResourceGroupList: List of resource groups with count
     """
+    logger.info("Listing resource groups")
+    pages = azure_service.iter_resource_group_pages()
+    
+    if wants_ndjson(request):
+        return await ndjson_response(request, pages)
+    
+    # Fetch the first page before streaming so Azure failures still map to an error status
     try:
-        logger.info("Listing resource groups")
-        resource_groups = await azure_service.list_resource_groups()
-        
-        return ResourceGroupList(
-            resource_groups=resource_groups,
-            count=len(resource_groups)
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to list resource groups: {e}")
-        raise AzureConnectionError(
-            detail="Failed to retrieve resource groups from Azure",
-            correlation_id=correlation_id.get()
-        )
+        first_page = await pages.__anext__()
+    except StopAsyncIteration:
+        first_page = []
+    
+    return stream_response(
+        request,
+        _stream_resource_group_list(first_page, pages),
+        "application/json"
+    )
 
 
 @router.get("/{name}", response_model=ResourceGroup, summary="Get a specific resource group")
@@ -64,22 +98,8 @@ async def get_resource_group(
     Returns:
         ResourceGroup: The resource group details
     """
-    try:
-        logger.info(f"Getting resource group: {name}")
-        return await azure_service.get_resource_group(name)
-        
-    except AzureResourceNotFoundError:
-        raise ResourceNotFoundError(
-            resource_name=name,
-            resource_type="resource group",
-            correlation_id=correlation_id.get()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get resource group {name}: {e}")
-        raise AzureConnectionError(
-            detail=f"Failed to retrieve resource group '{name}' from Azure",
-            correlation_id=correlation_id.get()
-        )
+    logger.info("Getting resource group: %s", name)
+    return await azure_service.get_resource_group(name)
 
 
 @router.post("/", response_model=ResourceGroup, status_code=status.HTTP_201_CREATED, 
@@ -97,24 +117,8 @@ async def create_resource_group(
     Returns:
         ResourceGroup: The created resource group
     """
-    try:
-        logger.info(f"Creating resource group: {resource_group.name}")
-        return await azure_service.create_resource_group(resource_group)
-        
-    except Exception as e:
-        logger.error(f"Failed to create resource group {resource_group.name}: {e}")
-        
-        # Check if it's a conflict error (already exists)
-        if "already exists" in str(e).lower() or "conflict" in str(e).lower():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Resource group '{resource_group.name}' already exists"
-            )
-        
-        raise AzureConnectionError(
-            detail=f"Failed to create resource group '{resource_group.name}'",
-            correlation_id=correlation_id.get()
-        )
+    logger.info("Creating resource group: %s", resource_group.name)
+    return await azure_service.create_resource_group(resource_group)
 
 
 @router.put("/{name}", response_model=ResourceGroup, summary="Update a resource group")
@@ -133,22 +137,8 @@ async def update_resource_group(
     Returns:
         ResourceGroup: The updated resource group
     """
-    try:
-        logger.info(f"Updating resource group: {name}")
-        return await azure_service.update_resource_group(name, update_data)
-        
-    except AzureResourceNotFoundError:
-        raise ResourceNotFoundError(
-            resource_name=name,
-            resource_type="resource group",
-            correlation_id=correlation_id.get()
-        )
-    except Exception as e:
-        logger.error(f"Failed to update resource group {name}: {e}")
-        raise AzureConnectionError(
-            detail=f"Failed to update resource group '{name}'",
-            correlation_id=correlation_id.get()
-        )
+    logger.info("Updating resource group: %s", name)
+    return await azure_service.update_resource_group(name, update_data)
 
 
 @router.delete("/{name}", status_code=status.HTTP_202_ACCEPTED, 
@@ -168,24 +158,10 @@ async def delete_resource_group(
     Returns:
         dict: Deletion status message
     """
-    try:
-        logger.info(f"Deleting resource group: {name}")
-        await azure_service.delete_resource_group(name)
-        
-        return {
-            "message": f"Resource group '{name}' deletion initiated",
-            "note": "Deletion is asynchronous and may take several minutes to complete"
-        }
-        
-    except AzureResourceNotFoundError:
-        raise ResourceNotFoundError(
-            resource_name=name,
-            resource_type="resource group",
-            correlation_id=correlation_id.get()
-        )
-    except Exception as e:
-        logger.error(f"Failed to delete resource group {name}: {e}")
-        raise AzureConnectionError(
-            detail=f"Failed to delete resource group '{name}'",
-            correlation_id=correlation_id.get()
-        )
\ No newline at end of file
+    logger.info("Deleting resource group: %s", name)
+    await azure_service.delete_resource_group(name)
+    
+    return {
+        "message": f"Resource group '{name}' deletion initiated",
+        "note": "Deletion is asynchronous and may take several minutes to complete"
+    }
@@ -1,51 +1,80 @@
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
 
+from api.core.etag import etag_matches, make_etag
 from api.core.logging import get_logger
+from api.core.streaming import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 from api.models.resource_group import (
     StorageAccount, StorageAccountCreate, StorageAccountUpdate, StorageAccountList,
     ErrorResponse
 )
-from api.services.azure_service import AzureService
-from api.core.config import get_settings
+from api.services.azure_service import AzureService, get_azure_service
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/storage-accounts", tags=["storage-accounts"])
+router = APIRouter(
+    prefix="/storage-accounts",
+    tags=["storage-accounts"],
+    default_response_class=ORJSONResponse
+)
 
 
-def get_azure_service() -> AzureService:
-    """Dependency to get Azure service instance."""
-    return AzureService(get_settings())
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a model straight to JSON bytes with its compiled Pydantic serializer.
+    
+    Returning a Response bypasses FastAPI's response_model re-validation; the
+    response_model declarations are kept for the OpenAPI docs.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
 
 
 @router.get(
     "",
     response_model=StorageAccountList,
     summary="List storage accounts",
-    description="Retrieve all storage accounts in the subscription"
+    description="Retrieve all storage accounts in the subscription",
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "Storage accounts, or NDJSON when requested"}
+    }
 )
 async def list_storage_accounts(
+    request: Request,
     azure_service: AzureService = Depends(get_azure_service)
-) -> StorageAccountList:
-    """List all storage accounts in the subscription."""
-    try:
-        logger.info("API: Listing storage accounts")
-        
-        storage_accounts = await azure_service.list_storage_accounts()
-        
-        return StorageAccountList(
-            storage_accounts=storage_accounts,
-            count=len(storage_accounts)
-        )
-        
-    except Exception as e:
-        logger.error(f"API: Failed to list storage accounts: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list storage accounts: {str(e)}"
-        )
+) -> Response:
+    """List all storage accounts in the subscription.
+    
+    The response carries an ETag so polling clients can revalidate with
+    If-None-Match and get an empty 304 when nothing changed. Clients sending
+    ``Accept: application/x-ndjson`` instead get one account per line,
+    streamed page by page straight from Azure.
+    """
+    logger.info("API: Listing storage accounts")
+    
+    if wants_ndjson(request):
+        return await ndjson_response(request, azure_service.iter_storage_account_pages())
+    
+    storage_accounts = await azure_service.list_storage_accounts()
+    
+    content = StorageAccountList.model_construct(
+        storage_accounts=storage_accounts,
+        count=len(storage_accounts)
+    ).model_dump_json().encode()
+    # no-cache: browsers keep the body but revalidate on every fetch, so a
+    # refresh right after a write never shows a stale list
+    headers = {
+        "ETag": make_etag(content),
+        "Cache-Control": "private, no-cache"
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -61,27 +90,12 @@ async def get_storage_account(
     resource_group: str,
     name: str,
     azure_service: AzureService = Depends(get_azure_service)
-) -> StorageAccount:
+) -> Response:
     """Get a specific storage account by resource group and name."""
-    try:
-        logger.info(f"API: Getting storage account {name} in resource group {resource_group}")
-        
-        return await azure_service.get_storage_account(resource_group, name)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"API: Failed to get storage account {name}: {e}")
-        if "not found" in str(e).lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Storage account '{name}' not found in resource group '{resource_group}'"
-            )
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get storage account: {str(e)}"
-        )
+    logger.info("API: Getting storage account %s in resource group %s", name, resource_group)
+    
+    result = await azure_service.get_storage_account(resource_group, name)
+    return _model_response(result)
 
 
 @router.post(
@@ -98,37 +112,14 @@ async def get_storage_account(
 async def create_storage_account(
     storage_account: StorageAccountCreate,
     azure_service: AzureService = Depends(get_azure_service)
-) -> StorageAccount:
+) -> Response:
     """Create a new storage account."""
-    try:
-        logger.info(f"API: Creating storage account {storage_account.name}")
-        
-        result = await azure_service.create_storage_account(storage_account)
-        
-        logger.info(f"API: Successfully created storage account {storage_account.name}")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"API: Failed to create storage account {storage_account.name}: {e}")
-        
-        error_msg = str(e).lower()
-        if "already exists" in error_msg or "conflict" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Storage account '{storage_account.name}' already exists"
-            )
-        elif "invalid" in error_msg or "bad request" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid storage account configuration: {str(e)}"
-            )
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create storage account: {str(e)}"
-        )
+    logger.info("API: Creating storage account %s", storage_account.name)
+    
+    result = await azure_service.create_storage_account(storage_account)
+    
+    logger.info("API: Successfully created storage account %s", storage_account.name)
+    return _model_response(result, status_code=status.HTTP_201_CREATED)
 
 
 @router.put(
@@ -145,31 +136,14 @@ async def update_storage_account(
     name: str,
     update: StorageAccountUpdate,
     azure_service: AzureService = Depends(get_azure_service)
-) -> StorageAccount:
+) -> Response:
     """Update an existing storage account."""
-    try:
-        logger.info(f"API: Updating storage account {name} in resource group {resource_group}")
-        
-        result = await azure_service.update_storage_account(resource_group, name, update)
-        
-        logger.info(f"API: Successfully updated storage account {name}")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"API: Failed to update storage account {name}: {e}")
-        
-        if "not found" in str(e).lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Storage account '{name}' not found in resource group '{resource_group}'"
-            )
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update storage account: {str(e)}"
-        )
+    logger.info("API: Updating storage account %s in resource group %s", name, resource_group)
+    
+    result = await azure_service.update_storage_account(resource_group, name, update)
+    
+    logger.info("API: Successfully updated storage account %s", name)
+    return _model_response(result)
 
 
 @router.delete(
@@ -185,36 +159,19 @@ async def delete_storage_account(
     resource_group: str,
     name: str,
     azure_service: AzureService = Depends(get_azure_service)
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Delete a storage account."""
-    try:
-        logger.info(f"API: Deleting storage account {name} in resource group {resource_group}")
-        
-        await azure_service.delete_storage_account(resource_group, name)
-        
-        logger.info(f"API: Successfully deleted storage account {name}")
-        
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "message": f"Storage account '{name}' deleted successfully",
-                "resource_group": resource_group,
-                "name": name
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"API: Failed to delete storage account {name}: {e}")
-        
-        if "not found" in str(e).lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Storage account '{name}' not found in resource group '{resource_group}'"
-            )
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete storage account: {str(e)}"
-        )
\ No newline at end of file
+    logger.info("API: Deleting storage account %s in resource group %s", name, resource_group)
+    
+    await azure_service.delete_storage_account(resource_group, name)
+    
+    logger.info("API: Successfully deleted storage account %s", name)
+    
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "message": f"Storage account '{name}' deleted successfully",
+            "resource_group": resource_group,
+            "name": name
+        }
+    )
\ No newline at end of file
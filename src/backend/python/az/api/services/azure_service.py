@@ -1,11 +1,41 @@
-from typing import List, Optional
+import asyncio
+import operator
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
-from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
+import requests
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceResponseError
+)
+from azure.core.pipeline.policies import HTTPPolicy
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.credentials import AccessToken, AccessTokenInfo, TokenCredential, TokenRequestOptions
+from azure.identity import (
+    AzureCliCredential,
+    ChainedTokenCredential,
+    ClientSecretCredential,
+    ManagedIdentityCredential
+)
 from azure.mgmt.resource import ResourceManagementClient
 from azure.mgmt.storage import StorageManagementClient
+from azure.mgmt.storage.models import (
+    AccessTier,
+    Kind,
+    Sku,
+    StorageAccountCreateParameters,
+    StorageAccountUpdateParameters
+)
+from fastapi.concurrency import run_in_threadpool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from api.core.config import Settings
+from api.core.cache import SingleFlight, TTLCache
+from api.core.config import Settings, get_settings
 from api.core.logging import get_logger
 from api.models.resource_group import (
     ResourceGroup, ResourceGroupCreate, ResourceGroupUpdate,
@@ -16,317 +46,612 @@ from api.models.resource_group import (
 logger = get_logger(__name__)
 
 
+# Upper-cased request values mapped to SDK enums, accepting both the wire value
+# ("BlobStorage") and the enum member name ("BLOB_STORAGE")
+_KIND_MAP = {kind.value.upper(): kind for kind in Kind} | {kind.name: kind for kind in Kind}
+_ACCESS_TIER_MAP = {tier.value.upper(): tier for tier in AccessTier}
+
+# Azure resource ID format: /subscriptions/{sub}/resourceGroups/{rg}/...
+_RESOURCE_GROUP_RE = re.compile(r"/resourceGroups/([^/]+)", re.IGNORECASE)
+
+# Reads every ResourceGroup field from an SDK object in one C-level call
+_resource_group_fields = operator.attrgetter(
+    "id", "name", "location", "tags", "type", "managed_by"
+)
+
+
+def _to_resource_group(rg) -> ResourceGroup:
+    """Convert an Azure SDK resource group into the API model without re-validation."""
+    rg_id, name, location, tags, rg_type, managed_by = _resource_group_fields(rg)
+    return ResourceGroup.model_construct(
+        id=rg_id,
+        name=name,
+        location=location,
+        tags=tags or {},
+        type=rg_type,
+        managed_by=managed_by
+    )
+
+
+# Storage account and endpoint fields read in one C-level call each
+_storage_account_fields = operator.attrgetter(
+    "id", "name", "location", "kind", "sku", "access_tier",
+    "allow_blob_public_access", "allow_shared_key_access", "tags",
+    "creation_time", "primary_endpoints"
+)
+_storage_endpoint_fields = operator.attrgetter("blob", "queue", "table", "file")
+
+
+def _to_storage_account(sa, resource_group: str) -> StorageAccount:
+    """Convert an Azure SDK storage account into the API model without re-validation."""
+    (
+        sa_id, name, location, kind, sku, access_tier,
+        allow_blob_public, allow_shared_key, tags, creation_time, endpoints
+    ) = _storage_account_fields(sa)
+    
+    primary_endpoints = None
+    if endpoints:
+        blob, queue, table, file = _storage_endpoint_fields(endpoints)
+        primary_endpoints = StorageEndpoints.model_construct(
+            blob=blob, queue=queue, table=table, file=file
+        )
+    
+    return StorageAccount.model_construct(
+        id=sa_id,
+        name=name,
+        location=location,
+        resource_group=resource_group,
+        kind=kind,
+        sku_name=sku.name if sku else None,
+        sku_tier=sku.tier if sku else None,
+        access_tier=access_tier,
+        allow_blob_public=allow_blob_public,
+        allow_shared_key=allow_shared_key,
+        tags=tags or {},
+        creation_time=creation_time,
+        primary_endpoints=primary_endpoints
+    )
+
+
+def _next_page(pages: Iterator) -> Optional[list]:
+    """Fetch the next page from an SDK page iterator, or None when exhausted."""
+    page = next(pages, None)
+    return None if page is None else list(page)
+
+
+async def _collect(pages: AsyncIterator[list]) -> list:
+    """Drain an async page iterator into a single list."""
+    items = []
+    async for page in pages:
+        items.extend(page)
+    return items
+
+
+async def _prefetch_pages(pages: Iterator) -> AsyncIterator[list]:
+    """Yield SDK pages, fetching the next one in the threadpool while the caller handles the current one.
+    
+    Continuation tokens make paging inherently serial, so this pipelines one
+    page ahead rather than fetching pages concurrently.
+    """
+    pending = asyncio.ensure_future(run_in_threadpool(_next_page, pages))
+    try:
+        while True:
+            page = await pending
+            if page is None:
+                return
+            pending = asyncio.ensure_future(run_in_threadpool(_next_page, pages))
+            yield page
+    finally:
+        # Consumer stopped early: don't leave the lookahead fetch unobserved
+        if not pending.done():
+            pending.cancel()
+
+
+class _StickyChainedTokenCredential(ChainedTokenCredential):
+    """ChainedTokenCredential that goes straight to the credential that last succeeded.
+    
+    Token refreshes then skip sources that already failed once, such as the
+    managed identity endpoint on a developer machine, the same way
+    DefaultAzureCredential does.
+    """
+    
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        if self._successful_credential is not None:
+            return self._successful_credential.get_token(*scopes, **kwargs)
+        return super().get_token(*scopes, **kwargs)
+    
+    def get_token_info(self, *scopes: str, options: Optional[TokenRequestOptions] = None) -> AccessTokenInfo:
+        if self._successful_credential is not None:
+            return self._successful_credential.get_token_info(*scopes, options=options)
+        return super().get_token_info(*scopes, options=options)
+
+
+def _response_status(pipeline_response, deserialized, headers) -> int:
+    """SDK ``cls`` callback returning the raw HTTP status of an operation."""
+    return pipeline_response.http_response.status_code
+
+
+class _BackgroundRefreshCredential:
+    """Serve cached tokens and renew them on a background thread before they expire.
+    
+    The clients' bearer token policy asks for a new token a few minutes before
+    expiry. Answering that from the cache and refreshing off-thread keeps the
+    token round trip off the request that happened to trigger it. Requests with
+    claims (CAE challenges) always go to the wrapped credential.
+    """
+    
+    # Refresh once less than this much lifetime remains; above the policy's own 5 minute margin
+    _REFRESH_MARGIN = 600
+    # Below this the cached token is too close to expiry to hand out while refreshing
+    _MIN_LIFETIME = 60
+    
+    def __init__(self, credential: TokenCredential):
+        self._credential = credential
+        self._tokens: dict = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+    
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        if kwargs.get("claims"):
+            return self._credential.get_token(*scopes, **kwargs)
+        
+        key = (scopes, tuple(sorted(kwargs.items())))
+        token = self._tokens.get(key)
+        remaining = token.expires_on - time.time() if token is not None else 0
+        if remaining < self._MIN_LIFETIME:
+            return self._fetch(key)
+        
+        if remaining < self._REFRESH_MARGIN:
+            with self._lock:
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(target=self._refresh, args=(key,), daemon=True).start()
+        return token
+    
+    def close(self) -> None:
+        self._credential.close()
+    
+    def _fetch(self, key) -> AccessToken:
+        scopes, kwargs = key
+        token = self._credential.get_token(*scopes, **dict(kwargs))
+        self._tokens[key] = token
+        return token
+    
+    def _refresh(self, key) -> None:
+        try:
+            self._fetch(key)
+        except Exception as e:
+            # The old token is still valid; the next request retries the refresh
+            logger.warning("Background Azure token refresh failed: %s", e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class _CircuitBreaker:
+    """Fail fast while Azure keeps throttling or failing.
+    
+    After ``fail_max`` consecutive throttled or failed calls the circuit opens
+    and calls are rejected immediately. Once ``reset_timeout`` seconds have
+    passed a single call is let through to probe Azure (half-open); everything
+    else keeps failing fast until that probe either closes the circuit or
+    re-opens it for another ``reset_timeout``.
+    """
+    
+    def __init__(self, fail_max: int = 10, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> bool:
+        """Admit a call, returning whether it is the half-open probe.
+        
+        Raises ServiceRequestError while the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise ServiceRequestError("Azure is throttling or unavailable; failing fast while the circuit is open")
+            self._probing = True
+            return True
+    
+    def release_probe(self) -> None:
+        """Free the probe slot without recording an outcome."""
+        with self._lock:
+            self._probing = False
+    
+    def record(self, failed: bool, probe: bool) -> None:
+        """Record the outcome of an admitted call."""
+        with self._lock:
+            if probe:
+                self._probing = False
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("Opening Azure circuit breaker after %s consecutive failures", self._failures)
+                self._opened_at = time.monotonic()
+
+
+class _CircuitBreakerPolicy(HTTPPolicy):
+    """Pipeline policy that routes calls through a shared _CircuitBreaker.
+    
+    Sits in front of the retry policy, so the breaker only sees the outcome of
+    a call once its retries are exhausted. azure-core links each policy to the
+    next one in its own pipeline, so every client needs its own instance; the
+    breaker state behind them is what gets shared.
+    """
+    
+    _FAILURE_STATUS = frozenset({429, 502, 503, 504})
+    
+    def __init__(self, breaker: _CircuitBreaker):
+        super().__init__()
+        self.breaker = breaker
+    
+    def send(self, request):
+        probe = self.breaker.acquire()
+        
+        try:
+            response = self.next.send(request)
+        except (ServiceRequestError, ServiceResponseError):
+            self.breaker.record(failed=True, probe=probe)
+            raise
+        except BaseException:
+            # Not an Azure outcome (e.g. a bug or cancellation): just free the probe slot
+            if probe:
+                self.breaker.release_probe()
+            raise
+        
+        self.breaker.record(failed=response.http_response.status_code in self._FAILURE_STATUS, probe=probe)
+        return response
+
+
+def _create_http_session(pool_size: int) -> requests.Session:
+    """Create a pooled keep-alive session for the azure-core transports."""
+    session = requests.Session()
+    # Retries stay with the azure-core retry policy, so disable them at the urllib3 level
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class AzureService:
     """Azure service for managing Azure resources."""
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.resource_client = self._create_resource_client()
-        self.storage_client = self._create_storage_client()
+        self._cache = TTLCache(maxsize=1024, ttl=settings.azure_cache_ttl)
+        # Identical reads that arrive while one is in flight share its ARM call
+        self._inflight = SingleFlight()
+        # One credential for both clients so a token acquired once is reused
+        self.credential = self._create_credential()
+        # One connection pool for both clients; they all talk to management.azure.com
+        self._http_session = _create_http_session(settings.azure_http_pool_size)
+        # Shared so throttling seen by either client opens the circuit for both
+        self._circuit_breaker = _CircuitBreaker()
+        # Management clients are built on first use, see the properties below
+        self._client_lock = threading.Lock()
+        self._resource_client: Optional[ResourceManagementClient] = None
+        self._storage_client: Optional[StorageManagementClient] = None
+    
+    @property
+    def resource_client(self) -> ResourceManagementClient:
+        """Azure resource management client, created on first use."""
+        if self._resource_client is None:
+            with self._client_lock:
+                if self._resource_client is None:
+                    self._resource_client = self._create_resource_client()
+        return self._resource_client
+    
+    @property
+    def storage_client(self) -> StorageManagementClient:
+        """Azure storage management client, created on first use."""
+        if self._storage_client is None:
+            with self._client_lock:
+                if self._storage_client is None:
+                    self._storage_client = self._create_storage_client()
+        return self._storage_client
+    
+    def _ensure_clients(self) -> None:
+        """Build both management clients now instead of on first use."""
+        _ = self.resource_client
+        _ = self.storage_client
+    
+    def _create_credential(self) -> TokenCredential:
+        """Create the Azure credential shared by all management clients."""
+        return _BackgroundRefreshCredential(self._create_base_credential())
+    
+    def _create_base_credential(self) -> TokenCredential:
+        """Pick the Azure credential source from the configured settings."""
+        # Try service principal authentication first
+        if all([
+            self.settings.azure_client_id,
+            self.settings.azure_client_secret,
+            self.settings.azure_tenant_id
+        ]):
+            logger.info("Using service principal authentication")
+            return ClientSecretCredential(
+                tenant_id=self.settings.azure_tenant_id,
+                client_id=self.settings.azure_client_id,
+                client_secret=self.settings.azure_client_secret
+            )
+        
+        # Fall back to managed identity (Azure-hosted) and Azure CLI (development)
+        # only, instead of probing every source DefaultAzureCredential knows about.
+        # A client ID without a secret selects a user-assigned managed identity.
+        logger.info("Using managed identity / Azure CLI credential")
+        return _StickyChainedTokenCredential(
+            ManagedIdentityCredential(client_id=self.settings.azure_client_id),
+            AzureCliCredential()
+        )
+    
+    def _pipeline_options(self) -> dict:
+        """Transport, retry and circuit breaker settings shared by the management clients."""
+        return {
+            "transport": RequestsTransport(session=self._http_session),
+            # azure-core defaults to 10 retries with up to 120s backoff; keep tail latency bounded
+            "retry_total": self.settings.azure_retry_total,
+            "retry_backoff_factor": 0.8,
+            "per_call_policies": [_CircuitBreakerPolicy(self._circuit_breaker)]
+        }
     
     def _create_resource_client(self) -> ResourceManagementClient:
         """Create Azure resource management client with proper authentication."""
         try:
-            # Try service principal authentication first
-            if all([
-                self.settings.azure_client_id,
-                self.settings.azure_client_secret,
-                self.settings.azure_tenant_id
-            ]):
-                logger.info("Using service principal authentication")
-                credential = ClientSecretCredential(
-                    tenant_id=self.settings.azure_tenant_id,
-                    client_id=self.settings.azure_client_id,
-                    client_secret=self.settings.azure_client_secret
-                )
-            else:
-                # Fall back to default credential (managed identity, Azure CLI, etc.)
-                logger.info("Using default Azure credential")
-                credential = DefaultAzureCredential()
-            
             client = ResourceManagementClient(
-                credential=credential,
-                subscription_id=self.settings.azure_subscription_id
+                credential=self.credential,
+                subscription_id=self.settings.azure_subscription_id,
+                **self._pipeline_options()
             )
             
             logger.info("Successfully created Azure resource client")
             return client
             
         except Exception as e:
-            logger.error(f"Failed to create Azure resource client: {e}")
+            logger.error("Failed to create Azure resource client: %s", e)
             raise
     
     def _create_storage_client(self) -> StorageManagementClient:
         """Create Azure storage management client with proper authentication."""
         try:
-            # Use the same credential as resource client
-            if all([
-                self.settings.azure_client_id,
-                self.settings.azure_client_secret,
-                self.settings.azure_tenant_id
-            ]):
-                logger.info("Using service principal authentication for storage client")
-                credential = ClientSecretCredential(
-                    tenant_id=self.settings.azure_tenant_id,
-                    client_id=self.settings.azure_client_id,
-                    client_secret=self.settings.azure_client_secret
-                )
-            else:
-                logger.info("Using default Azure credential for storage client")
-                credential = DefaultAzureCredential()
-            
             client = StorageManagementClient(
-                credential=credential,
-                subscription_id=self.settings.azure_subscription_id
+                credential=self.credential,
+                subscription_id=self.settings.azure_subscription_id,
+                **self._pipeline_options()
             )
             
             logger.info("Successfully created Azure storage client")
             return client
             
         except Exception as e:
-            logger.error(f"Failed to create Azure storage client: {e}")
+            logger.error("Failed to create Azure storage client: %s", e)
             raise
     
+    async def warmup(self) -> None:
+        """Build the clients and make one ARM call so the first request skips token and TLS setup."""
+        # Both clients are built here, in every worker, so the lazy properties only
+        # matter for code that uses the service without the app lifespan
+        self._ensure_clients()
+        # test_connection acquires a token and opens a pooled connection as a side effect
+        if await self.test_connection():
+            logger.info("Azure clients warmed up")
+        else:
+            logger.warning("Azure warm-up failed; the first requests will pay the connection setup cost")
+    
+    async def aclose(self) -> None:
+        """Close the management clients, their shared connection pool and the credential."""
+        for client in (self._resource_client, self._storage_client):
+            if client is not None:
+                client.close()
+        self._http_session.close()
+        self.credential.close()
+    
     async def test_connection(self) -> bool:
         """Test Azure connection."""
         try:
-            # Try to list resource groups (limited to 1) to test connectivity
-            list(self.resource_client.resource_groups.list(top=1))
+            # Fetch a single resource group to test connectivity; next() stops after
+            # the first page instead of draining the pager like list() would
+            await run_in_threadpool(next, iter(self.resource_client.resource_groups.list(top=1)), None)
             logger.info("Azure connectivity test successful")
             return True
         except Exception as e:
-            logger.error(f"Azure connectivity test failed: {e}")
+            logger.error("Azure connectivity test failed: %s", e)
             return False
     
-    async def list_resource_groups(self) -> List[ResourceGroup]:
-        """List all resource groups in the subscription."""
-        try:
-            logger.info("Listing resource groups")
-            resource_groups = []
-            
-            for rg in self.resource_client.resource_groups.list():
-                resource_groups.append(ResourceGroup(
-                    id=rg.id,
-                    name=rg.name,
-                    location=rg.location,
-                    tags=rg.tags or {},
-                    type=rg.type,
-                    managed_by=rg.managed_by
-                ))
-            
-            logger.info(f"Found {len(resource_groups)} resource groups")
-            return resource_groups
-            
-        except Exception as e:
-            logger.error(f"Failed to list resource groups: {e}")
-            raise
+    async def iter_resource_group_pages(self) -> AsyncIterator[List[ResourceGroup]]:
+        """Yield the subscription's resource groups one SDK page at a time."""
+        pages = self.resource_client.resource_groups.list().by_page()
+        
+        # Each page is a blocking HTTP call, so fetch pages off the event loop
+        async for page in _prefetch_pages(pages):
+            yield [_to_resource_group(rg) for rg in page]
     
     async def get_resource_group(self, name: str) -> ResourceGroup:
         """Get a specific resource group by name."""
+        cache_key = ("resource_group", name.lower())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            logger.info(f"Getting resource group: {name}")
-            
-            rg = self.resource_client.resource_groups.get(name)
+            logger.info("Getting resource group: %s", name)
             
-            return ResourceGroup(
-                id=rg.id,
-                name=rg.name,
-                location=rg.location,
-                tags=rg.tags or {},
-                type=rg.type,
-                managed_by=rg.managed_by
+            rg = await self._inflight.do(
+                cache_key, lambda: run_in_threadpool(self.resource_client.resource_groups.get, name)
             )
             
+            result = _to_resource_group(rg)
+            self._cache.set(cache_key, result)
+            return result
+            
         except ResourceNotFoundError:
-            logger.warning(f"Resource group not found: {name}")
+            logger.warning("Resource group not found: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to get resource group {name}: {e}")
+            logger.error("Failed to get resource group %s: %s", name, e)
             raise
     
     async def create_resource_group(self, resource_group: ResourceGroupCreate) -> ResourceGroup:
         """Create a new resource group."""
         try:
-            logger.info(f"Creating resource group: {resource_group.name}")
+            logger.info("Creating resource group: %s", resource_group.name)
             
             parameters = {
                 "location": resource_group.location,
                 "tags": resource_group.tags or {}
             }
             
-            result = self.resource_client.resource_groups.create_or_update(
+            result = await run_in_threadpool(
+                self.resource_client.resource_groups.create_or_update,
                 resource_group.name,
                 parameters
             )
             
-            logger.info(f"Successfully created resource group: {resource_group.name}")
+            logger.info("Successfully created resource group: %s", resource_group.name)
+            self._cache.invalidate(("resource_group", resource_group.name.lower()))
             
-            return ResourceGroup(
-                id=result.id,
-                name=result.name,
-                location=result.location,
-                tags=result.tags or {},
-                type=result.type,
-                managed_by=result.managed_by
-            )
+            return _to_resource_group(result)
             
         except HttpResponseError as e:
-            logger.error(f"Azure API error creating resource group {resource_group.name}: {e}")
+            logger.error("Azure API error creating resource group %s: %s", resource_group.name, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to create resource group {resource_group.name}: {e}")
+            logger.error("Failed to create resource group %s: %s", resource_group.name, e)
             raise
     
     async def update_resource_group(self, name: str, update: ResourceGroupUpdate) -> ResourceGroup:
         """Update an existing resource group."""
         try:
-            logger.info(f"Updating resource group: {name}")
-            
-            # First check if resource group exists
-            await self.get_resource_group(name)
+            logger.info("Updating resource group: %s", name)
             
+            # No existence pre-check: the update call raises ResourceNotFoundError itself
             # Update only tags (location cannot be changed)
             parameters = {
                 "tags": update.tags or {}
             }
             
-            result = self.resource_client.resource_groups.update(name, parameters)
+            result = await run_in_threadpool(
+                self.resource_client.resource_groups.update, name, parameters
+            )
             
-            logger.info(f"Successfully updated resource group: {name}")
+            logger.info("Successfully updated resource group: %s", name)
+            self._cache.invalidate(("resource_group", name.lower()))
             
-            return ResourceGroup(
-                id=result.id,
-                name=result.name,
-                location=result.location,
-                tags=result.tags or {},
-                type=result.type,
-                managed_by=result.managed_by
-            )
+            return _to_resource_group(result)
             
         except ResourceNotFoundError:
-            logger.warning(f"Cannot update non-existent resource group: {name}")
+            logger.warning("Cannot update non-existent resource group: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to update resource group {name}: {e}")
+            logger.error("Failed to update resource group %s: %s", name, e)
             raise
     
     async def delete_resource_group(self, name: str) -> None:
         """Delete a resource group."""
         try:
-            logger.info(f"Deleting resource group: {name}")
-            
-            # Check if resource group exists first
-            await self.get_resource_group(name)
+            logger.info("Deleting resource group: %s", name)
             
+            # No existence pre-check: ARM answers a missing group with 404, which
+            # surfaces as ResourceNotFoundError when the poller is created
             # Start the deletion (this is an async operation in Azure)
-            delete_operation = self.resource_client.resource_groups.begin_delete(name)
+            delete_operation = await run_in_threadpool(
+                self.resource_client.resource_groups.begin_delete, name
+            )
             
-            logger.info(f"Started deletion of resource group: {name}")
+            logger.info("Started deletion of resource group: %s", name)
+            # Deleting a resource group also removes every storage account in it
+            self._cache.clear()
             # Note: We don't wait for completion as it can take a long time
             
         except ResourceNotFoundError:
-            logger.warning(f"Cannot delete non-existent resource group: {name}")
+            logger.warning("Cannot delete non-existent resource group: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to delete resource group {name}: {e}")
+            logger.error("Failed to delete resource group %s: %s", name, e)
             raise
     
     # Storage Account Methods
     
+    async def iter_storage_account_pages(self) -> AsyncIterator[List[StorageAccount]]:
+        """Yield the subscription's storage accounts one SDK page at a time."""
+        pages = self.storage_client.storage_accounts.list().by_page()
+        
+        # Convert each page while the next one is being fetched off the event loop
+        async for page in _prefetch_pages(pages):
+            # Build the models in the threadpool so large pages don't block the loop
+            yield await run_in_threadpool(self._to_storage_accounts, page)
+    
     async def list_storage_accounts(self) -> List[StorageAccount]:
         """List all storage accounts in the subscription."""
+        cached = self._cache.get(("storage_accounts",))
+        if cached is not None:
+            return cached
+        
         try:
             logger.info("Listing storage accounts")
-            storage_accounts = []
             
-            for sa in self.storage_client.storage_accounts.list():
-                # Extract resource group from ID
-                resource_group = self._extract_resource_group_from_id(sa.id)
-                
-                endpoints = None
-                if sa.primary_endpoints:
-                    endpoints = StorageEndpoints(
-                        blob=sa.primary_endpoints.blob,
-                        queue=sa.primary_endpoints.queue,
-                        table=sa.primary_endpoints.table,
-                        file=sa.primary_endpoints.file
-                    )
-                
-                storage_accounts.append(StorageAccount(
-                    id=sa.id,
-                    name=sa.name,
-                    location=sa.location,
-                    resource_group=resource_group,
-                    kind=sa.kind,
-                    sku_name=sa.sku.name if sa.sku else None,
-                    sku_tier=sa.sku.tier if sa.sku else None,
-                    access_tier=sa.access_tier,
-                    allow_blob_public=sa.allow_blob_public_access,
-                    allow_shared_key=sa.allow_shared_key_access,
-                    tags=sa.tags or {},
-                    creation_time=sa.creation_time,
-                    primary_endpoints=endpoints
-                ))
-            
-            logger.info(f"Found {len(storage_accounts)} storage accounts")
+            storage_accounts = await self._inflight.do(
+                ("storage_accounts",), lambda: _collect(self.iter_storage_account_pages())
+            )
+            
+            logger.info("Found %s storage accounts", len(storage_accounts))
+            self._cache.set(("storage_accounts",), storage_accounts)
             return storage_accounts
             
         except Exception as e:
-            logger.error(f"Failed to list storage accounts: {e}")
+            logger.error("Failed to list storage accounts: %s", e)
             raise
     
     async def get_storage_account(self, resource_group: str, name: str) -> StorageAccount:
         """Get a specific storage account by name."""
+        cache_key = ("storage_account", resource_group.lower(), name.lower())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            logger.info(f"Getting storage account: {name} in resource group: {resource_group}")
-            
-            sa = self.storage_client.storage_accounts.get_properties(resource_group, name)
+            logger.info("Getting storage account: %s in resource group: %s", name, resource_group)
             
-            endpoints = None
-            if sa.primary_endpoints:
-                endpoints = StorageEndpoints(
-                    blob=sa.primary_endpoints.blob,
-                    queue=sa.primary_endpoints.queue,
-                    table=sa.primary_endpoints.table,
-                    file=sa.primary_endpoints.file
+            sa = await self._inflight.do(
+                cache_key,
+                lambda: run_in_threadpool(
+                    self.storage_client.storage_accounts.get_properties, resource_group, name
                 )
-            
-            return StorageAccount(
-                id=sa.id,
-                name=sa.name,
-                location=sa.location,
-                resource_group=resource_group,
-                kind=sa.kind,
-                sku_name=sa.sku.name if sa.sku else None,
-                sku_tier=sa.sku.tier if sa.sku else None,
-                access_tier=sa.access_tier,
-                allow_blob_public=sa.allow_blob_public_access,
-                allow_shared_key=sa.allow_shared_key_access,
-                tags=sa.tags or {},
-                creation_time=sa.creation_time,
-                primary_endpoints=endpoints
             )
             
+            result = _to_storage_account(sa, resource_group)
+            self._cache.set(cache_key, result)
+            return result
+            
         except ResourceNotFoundError:
-            logger.warning(f"Storage account not found: {name}")
+            logger.warning("Storage account not found: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to get storage account {name}: {e}")
+            logger.error("Failed to get storage account %s: %s", name, e)
             raise
     
     async def create_storage_account(self, storage_account: StorageAccountCreate) -> StorageAccount:
         """Create a new storage account."""
         try:
-            logger.info(f"Creating storage account: {storage_account.name}")
-            
-            from azure.mgmt.storage.models import (
-                StorageAccountCreateParameters, Sku, Kind, AccessTier
-            )
+            logger.info("Creating storage account: %s", storage_account.name)
             
             # Set defaults and validate
             kind = Kind.STORAGE_V2
             if storage_account.kind:
-                kind = getattr(Kind, storage_account.kind.upper().replace('V', '_V'), Kind.STORAGE_V2)
+                kind = _KIND_MAP.get(storage_account.kind.upper(), Kind.STORAGE_V2)
             
             sku = Sku(name=storage_account.sku_name or "Standard_LRS")
             
@@ -339,7 +664,7 @@ class AzureService:
             
             # Set optional parameters
             if storage_account.access_tier:
-                parameters.access_tier = getattr(AccessTier, storage_account.access_tier.upper(), None)
+                parameters.access_tier = _ACCESS_TIER_MAP.get(storage_account.access_tier.upper())
             
             if storage_account.allow_blob_public is not None:
                 parameters.allow_blob_public_access = storage_account.allow_blob_public
@@ -348,66 +673,41 @@ class AzureService:
                 parameters.allow_shared_key_access = storage_account.allow_shared_key
             
             # Start creation (this is an async operation)
-            create_operation = self.storage_client.storage_accounts.begin_create(
+            create_operation = await run_in_threadpool(
+                self.storage_client.storage_accounts.begin_create,
                 storage_account.resource_group,
                 storage_account.name,
                 parameters
             )
             
-            # Wait for completion
-            result = create_operation.result()
+            # Wait for completion; polling sleeps between calls, so keep it in the threadpool
+            result = await run_in_threadpool(create_operation.result)
             
-            logger.info(f"Successfully created storage account: {storage_account.name}")
-            
-            endpoints = None
-            if result.primary_endpoints:
-                endpoints = StorageEndpoints(
-                    blob=result.primary_endpoints.blob,
-                    queue=result.primary_endpoints.queue,
-                    table=result.primary_endpoints.table,
-                    file=result.primary_endpoints.file
-                )
+            logger.info("Successfully created storage account: %s", storage_account.name)
+            self._invalidate_storage_account(storage_account.resource_group, storage_account.name)
             
-            return StorageAccount(
-                id=result.id,
-                name=result.name,
-                location=result.location,
-                resource_group=storage_account.resource_group,
-                kind=result.kind,
-                sku_name=result.sku.name if result.sku else None,
-                sku_tier=result.sku.tier if result.sku else None,
-                access_tier=result.access_tier,
-                allow_blob_public=result.allow_blob_public_access,
-                allow_shared_key=result.allow_shared_key_access,
-                tags=result.tags or {},
-                creation_time=result.creation_time,
-                primary_endpoints=endpoints
-            )
+            return _to_storage_account(result, storage_account.resource_group)
             
         except HttpResponseError as e:
-            logger.error(f"Azure API error creating storage account {storage_account.name}: {e}")
+            logger.error("Azure API error creating storage account %s: %s", storage_account.name, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to create storage account {storage_account.name}: {e}")
+            logger.error("Failed to create storage account %s: %s", storage_account.name, e)
             raise
     
     async def update_storage_account(self, resource_group: str, name: str, update: StorageAccountUpdate) -> StorageAccount:
         """Update an existing storage account."""
         try:
-            logger.info(f"Updating storage account: {name}")
-            
-            from azure.mgmt.storage.models import StorageAccountUpdateParameters, AccessTier
-            
-            # First check if storage account exists
-            await self.get_storage_account(resource_group, name)
+            logger.info("Updating storage account: %s", name)
             
+            # No existence pre-check: the update call raises ResourceNotFoundError itself
             parameters = StorageAccountUpdateParameters()
             
             if update.tags is not None:
                 parameters.tags = update.tags
                 
             if update.access_tier:
-                parameters.access_tier = getattr(AccessTier, update.access_tier.upper(), None)
+                parameters.access_tier = _ACCESS_TIER_MAP.get(update.access_tier.upper())
                 
             if update.allow_blob_public is not None:
                 parameters.allow_blob_public_access = update.allow_blob_public
@@ -415,74 +715,78 @@ class AzureService:
             if update.allow_shared_key is not None:
                 parameters.allow_shared_key_access = update.allow_shared_key
             
-            result = self.storage_client.storage_accounts.update(resource_group, name, parameters)
-            
-            logger.info(f"Successfully updated storage account: {name}")
+            result = await run_in_threadpool(
+                self.storage_client.storage_accounts.update, resource_group, name, parameters
+            )
             
-            endpoints = None
-            if result.primary_endpoints:
-                endpoints = StorageEndpoints(
-                    blob=result.primary_endpoints.blob,
-                    queue=result.primary_endpoints.queue,
-                    table=result.primary_endpoints.table,
-                    file=result.primary_endpoints.file
-                )
+            logger.info("Successfully updated storage account: %s", name)
+            self._invalidate_storage_account(resource_group, name)
             
-            return StorageAccount(
-                id=result.id,
-                name=result.name,
-                location=result.location,
-                resource_group=resource_group,
-                kind=result.kind,
-                sku_name=result.sku.name if result.sku else None,
-                sku_tier=result.sku.tier if result.sku else None,
-                access_tier=result.access_tier,
-                allow_blob_public=result.allow_blob_public_access,
-                allow_shared_key=result.allow_shared_key_access,
-                tags=result.tags or {},
-                creation_time=result.creation_time,
-                primary_endpoints=endpoints
-            )
+            return _to_storage_account(result, resource_group)
             
         except ResourceNotFoundError:
-            logger.warning(f"Cannot update non-existent storage account: {name}")
+            logger.warning("Cannot update non-existent storage account: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to update storage account {name}: {e}")
+            logger.error("Failed to update storage account %s: %s", name, e)
             raise
     
     async def delete_storage_account(self, resource_group: str, name: str) -> None:
         """Delete a storage account."""
         try:
-            logger.info(f"Deleting storage account: {name}")
-            
-            # Check if storage account exists first
-            await self.get_storage_account(resource_group, name)
-            
-            # Delete the storage account
-            self.storage_client.storage_accounts.delete(resource_group, name)
+            logger.info("Deleting storage account: %s", name)
+            
+            # ARM answers a DELETE for a missing storage account with 204 rather than
+            # 404, so read the status off the delete itself instead of pre-fetching
+            status_code = await run_in_threadpool(
+                self.storage_client.storage_accounts.delete,
+                resource_group,
+                name,
+                cls=_response_status
+            )
+            # Either way the account is gone, so drop any cached copy
+            self._invalidate_storage_account(resource_group, name)
+            if status_code == 204:
+                raise ResourceNotFoundError(
+                    f"Storage account '{name}' not found in resource group '{resource_group}'"
+                )
             
-            logger.info(f"Successfully deleted storage account: {name}")
+            logger.info("Successfully deleted storage account: %s", name)
             
         except ResourceNotFoundError:
-            logger.warning(f"Cannot delete non-existent storage account: {name}")
+            logger.warning("Cannot delete non-existent storage account: %s", name)
             raise
         except Exception as e:
-            logger.error(f"Failed to delete storage account {name}: {e}")
+            logger.error("Failed to delete storage account %s: %s", name, e)
             raise
     
+    def _to_storage_accounts(self, page: list) -> List[StorageAccount]:
+        """Convert a page of SDK storage accounts, reading each resource group from its ID."""
+        return [_to_storage_account(sa, self._extract_resource_group_from_id(sa.id)) for sa in page]
+    
+    def _invalidate_storage_account(self, resource_group: str, name: str) -> None:
+        """Drop cached reads affected by a storage account change."""
+        self._cache.invalidate(
+            ("storage_accounts",),
+            ("storage_account", resource_group.lower(), name.lower())
+        )
+    
     def _extract_resource_group_from_id(self, resource_id: str) -> str:
         """Extract resource group name from Azure resource ID."""
-        if not resource_id:
-            return ""
-        
-        parts = resource_id.split('/')
-        try:
-            # Azure resource ID format: /subscriptions/{sub}/resourceGroups/{rg}/...
-            rg_index = parts.index('resourceGroups')
-            if rg_index + 1 < len(parts):
-                return parts[rg_index + 1]
-        except (ValueError, IndexError):
-            pass
-        
-        return ""
\ No newline at end of file
+        match = _RESOURCE_GROUP_RE.search(resource_id or "")
+        return match.group(1) if match else ""
+
+
+_azure_service: Optional[AzureService] = None
+_azure_service_lock = threading.Lock()
+
+
+def get_azure_service() -> AzureService:
+    """Get shared Azure service instance."""
+    global _azure_service
+    if _azure_service is None:
+        # FastAPI runs sync dependencies in the threadpool, so first requests can race here
+        with _azure_service_lock:
+            if _azure_service is None:
+                _azure_service = AzureService(get_settings())
+    return _azure_service
@@ -1,13 +1,13 @@
 def resource_group_create_or_update( name, 
                                      location,
                                      resource_client,
-                                     tags={}
+                                     tags=None
                                     ):
     rg_result = resource_client.resource_groups.create_or_update(
-        {name}, 
+        name, 
         {
-            "location": f'"{location}"',
-            "tags": {tags},
+            "location": location,
+            "tags": tags or {},
         },
     )
     return rg_result
@@ -15,6 +15,6 @@ def resource_group_create_or_update( name,
 def resource_group_show(name, resource_client, expandBy=""):
     rg_result = resource_client.resources.list_by_resource_group(
         name,
-        expand = {expandBy}
+        expand = expandBy or None
     )
     return rg_result
\ No newline at end of file
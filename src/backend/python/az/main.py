@@ -1,20 +1,31 @@
+import os
+from contextlib import asynccontextmanager
+
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from anyio import to_thread
+from azure.core.exceptions import AzureError
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
 
 from api.core.config import get_settings
+from api.core.etag import etag_matches, make_etag
 from api.core.logging import setup_logging, get_logger
 from api.core.exceptions import AzureAPIException
 from api.middleware.correlation import CorrelationMiddleware
 from api.middleware.error_handler import (
     azure_exception_handler,
+    azure_sdk_exception_handler,
     validation_exception_handler,
     http_exception_handler,
     general_exception_handler
 )
 from api.routers import health, resource_groups, storage_accounts
+from api.services.azure_service import get_azure_service
 
 # Initialize logging first
 setup_logging()
@@ -23,13 +34,37 @@ logger = get_logger(__name__)
 # Get settings
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown tasks."""
+    logger.info("Starting %s v%s", settings.app_name, settings.version)
+    logger.info("Debug mode: %s", settings.debug)
+    logger.info("Docs available at: /docs")
+    
+    # Every Azure SDK call runs in this threadpool; anyio's default of 40 threads
+    # would cap concurrent ARM calls below the connection pool size
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
+    # Pay credential, token and TLS setup before serving instead of on the first request
+    azure_service = get_azure_service()
+    await azure_service.warmup()
+    
+    yield
+    
+    logger.info("Shutting down %s", settings.app_name)
+    await azure_service.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     description="Production-ready Azure Resource Management API",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -41,11 +76,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress buffered responses; payloads under minimum_size (health, root info,
+# single resources) are sent as-is to skip the compression overhead. Streamed
+# lists compress themselves page by page (see api/core/streaming.py) and pass
+# through untouched, since this middleware would buffer them until the end
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Add custom middleware
 app.add_middleware(CorrelationMiddleware)
 
 # Add exception handlers
 app.add_exception_handler(AzureAPIException, azure_exception_handler)
+app.add_exception_handler(AzureError, azure_sdk_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -56,39 +98,42 @@ app.include_router(resource_groups.router, prefix=settings.api_v1_prefix)
 app.include_router(storage_accounts.router, prefix=settings.api_v1_prefix)
 
 
-@app.get("/", tags=["root"])
-async def root():
-    """Root endpoint with API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.version,
-        "status": "running",
-        "docs": "/docs",
-        "health": "/health"
-    }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Application startup tasks."""
-    logger.info(f"Starting {settings.app_name} v{settings.version}")
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"Docs available at: /docs")
+# The root payload only depends on settings, so serialize it once at import
+_ROOT_INFO = orjson.dumps({
+    "name": settings.app_name,
+    "version": settings.version,
+    "status": "running",
+    "docs": "/docs",
+    "health": "/health"
+})
+_ROOT_HEADERS = {"ETag": make_etag(_ROOT_INFO), "Cache-Control": "public, max-age=3600"}
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown tasks."""
-    logger.info(f"Shutting down {settings.app_name}")
+@app.get("/", tags=["root"])
+async def root(request: Request) -> Response:
+    """Root endpoint with API information."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, _ROOT_HEADERS["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_ROOT_HEADERS)
+    
+    return Response(content=_ROOT_INFO, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 if __name__ == "__main__":
-    logger.info(f"Starting server on {settings.host}:{settings.port}")
+    # Each worker is a separate process with its own Azure clients, pool and cache,
+    # so a write only invalidates the cache of the worker that served it; run a
+    # single worker unless WORKERS (or the platform's WEB_CONCURRENCY) asks for more.
+    # The reloader only supports a single process.
+    web_concurrency = int(os.environ.get("WEB_CONCURRENCY") or 0)
+    workers = 1 if settings.debug else (settings.workers or web_concurrency or 1)
+    logger.info("Starting server on %s:%s with %s worker(s)", settings.host, settings.port, workers)
     
+    # uvicorn[standard] installs uvloop and httptools, which uvicorn picks up automatically
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=workers,
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
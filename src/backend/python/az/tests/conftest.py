@@ -0,0 +1,118 @@
+import os
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# Settings require a subscription ID; no test talks to Azure
+os.environ.setdefault("AZURE_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("LOG_LEVEL", "CRITICAL")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from azure.core.exceptions import ResourceNotFoundError  # noqa: E402
+
+
+def fake_resource_group(name):
+    return SimpleNamespace(
+        id=f"/subscriptions/sub/resourceGroups/{name}",
+        name=name,
+        location="westeurope",
+        tags=None,
+        type="Microsoft.Resources/resourceGroups",
+        managed_by=None
+    )
+
+
+def fake_storage_account(name, resource_group="rg1"):
+    return SimpleNamespace(
+        id=f"/subscriptions/sub/resourceGroups/{resource_group}/providers/Microsoft.Storage/storageAccounts/{name}",
+        name=name,
+        location="westeurope",
+        kind="StorageV2",
+        sku=SimpleNamespace(name="Standard_LRS", tier="Standard"),
+        access_tier="Hot",
+        allow_blob_public_access=False,
+        allow_shared_key_access=True,
+        tags={"env": "test"},
+        creation_time=datetime(2024, 1, 1),
+        primary_endpoints=SimpleNamespace(blob="https://blob", queue=None, table=None, file=None)
+    )
+
+
+class FakePager:
+    """Stands in for an azure-core ItemPaged over a fixed list of pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __iter__(self):
+        return (item for page in self.pages for item in page)
+
+    def by_page(self, continuation_token=None):
+        return (iter(page) for page in self.pages)
+
+
+class FakeResourceGroups:
+    def __init__(self):
+        self.items = {name: fake_resource_group(name) for name in ("rg1", "rg2")}
+
+    def list(self, top=None, **kwargs):
+        items = list(self.items.values())
+        return FakePager([items[:top] if top else items])
+
+    def get(self, name, **kwargs):
+        if name not in self.items:
+            raise ResourceNotFoundError(f"Resource group '{name}' could not be found")
+        return self.items[name]
+
+
+class FakeStorageAccounts:
+    def __init__(self):
+        self.items = {("rg1", "sa1"): fake_storage_account("sa1"), ("rg2", "sa2"): fake_storage_account("sa2", "rg2")}
+
+    def list(self, **kwargs):
+        items = list(self.items.values())
+        # One account per page so streaming sees several pages
+        return FakePager([[item] for item in items])
+
+    def get_properties(self, resource_group, name, **kwargs):
+        if (resource_group, name) not in self.items:
+            raise ResourceNotFoundError(f"Storage account '{name}' could not be found")
+        return self.items[(resource_group, name)]
+
+    def delete(self, resource_group, name, cls=None, **kwargs):
+        # Like ARM, a missing account is answered with 204 rather than 404
+        status_code = 200 if self.items.pop((resource_group, name), None) else 204
+        response = SimpleNamespace(http_response=SimpleNamespace(status_code=status_code))
+        return cls(response, None, {}) if cls else None
+
+
+class FakeClient(SimpleNamespace):
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_azure(monkeypatch):
+    """Swap the Azure management clients for in-memory fakes."""
+    from api.services import azure_service
+
+    resource_client = FakeClient(resource_groups=FakeResourceGroups())
+    storage_client = FakeClient(storage_accounts=FakeStorageAccounts())
+    monkeypatch.setattr(azure_service.AzureService, "_create_resource_client", lambda self: resource_client)
+    monkeypatch.setattr(azure_service.AzureService, "_create_storage_client", lambda self: storage_client)
+    monkeypatch.setattr(azure_service, "_azure_service", None)
+    return SimpleNamespace(resource_client=resource_client, storage_client=storage_client)
+
+
+@pytest.fixture
+def client(fake_azure):
+    """Test client for the app, running its lifespan against the fake clients."""
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
@@ -0,0 +1,63 @@
+import json
+
+
+def test_storage_account_list_revalidates_with_etag(client):
+    response = client.get("/api/v1/storage-accounts")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/api/v1/storage-accounts", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    weak = client.get("/api/v1/storage-accounts", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_storage_account_list_etag_changes_after_delete(client):
+    etag = client.get("/api/v1/storage-accounts").headers["etag"]
+    assert client.delete("/api/v1/storage-accounts/rg1/sa1").status_code == 200
+
+    response = client.get("/api/v1/storage-accounts", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
+
+
+def test_root_answers_if_none_match_with_304(client):
+    response = client.get("/")
+    assert response.status_code == 200
+
+    not_modified = client.get("/", headers={"If-None-Match": response.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_ndjson_stream_is_gzipped(client):
+    response = client.get(
+        "/api/v1/storage-accounts",
+        headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-encoding"] == "gzip"
+    assert [json.loads(line)["name"] for line in response.text.splitlines()] == ["sa1", "sa2"]
+
+
+def test_resource_group_list_streams_a_json_document(client):
+    for encoding in ("gzip", "identity"):
+        response = client.get("/api/v1/resource-groups/", headers={"Accept-Encoding": encoding})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["count"] == 2
+        assert [rg["name"] for rg in body["resource_groups"]] == ["rg1", "rg2"]
+
+
+def test_missing_resource_group_maps_to_404(client):
+    response = client.get("/api/v1/resource-groups/missing")
+    assert response.status_code == 404
+    assert response.json()["error"] == "ResourceNotFoundError"
+
+
+def test_deleting_missing_storage_account_maps_to_404(client):
+    assert client.delete("/api/v1/storage-accounts/rg1/missing").status_code == 404
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from api.core import cache
+from api.core.cache import SingleFlight, TTLCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(cache, "time", fake_clock)
+    return fake_clock
+
+
+def test_ttl_cache_expires_entries(clock):
+    ttl_cache = TTLCache(ttl=30)
+    ttl_cache.set("key", "value")
+    assert ttl_cache.get("key") == "value"
+
+    clock.now += 30
+    assert ttl_cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl=30)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_disabled_with_zero_ttl():
+    ttl_cache = TTLCache(ttl=0)
+    ttl_cache.set("key", "value")
+    assert ttl_cache.get("key") is None
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        return results, calls, flight._calls
+
+    results, calls, pending = asyncio.run(scenario())
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert pending == {}
+
+
+def test_single_flight_shares_exceptions_and_cleans_up():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise LookupError("missing")
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)), return_exceptions=True)
+        return results, flight._calls
+
+    results, pending = asyncio.run(scenario())
+    assert all(isinstance(result, LookupError) for result in results)
+    assert pending == {}
+
+
+def test_single_flight_leader_cancellation_does_not_cancel_followers():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results, calls, flight._calls
+
+    results, calls, pending = asyncio.run(scenario())
+    assert results == ["result", "result"]
+    assert calls == 1
+    assert pending == {}
+
+
+def test_single_flight_starts_a_new_call_after_completion():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        first = await flight.do("key", fetch)
+        second = await flight.do("key", fetch)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
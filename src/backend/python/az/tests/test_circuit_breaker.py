@@ -0,0 +1,154 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from azure.core.exceptions import ServiceRequestError
+
+from api.core.config import get_settings
+from api.services import azure_service
+from api.services.azure_service import AzureService, _CircuitBreaker, _CircuitBreakerPolicy
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _FakeNext:
+    """Next pipeline policy answering with a fixed status, optionally blocking until released."""
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.entered = threading.Event()
+
+    def send(self, request):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return SimpleNamespace(http_response=SimpleNamespace(status_code=self.status_code))
+
+
+class _RaisingNext:
+    def send(self, request):
+        raise RuntimeError("not an Azure failure")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(azure_service, "time", fake_clock)
+    return fake_clock
+
+
+def _policy(status_code, fail_max=2, reset_timeout=30.0):
+    policy = _CircuitBreakerPolicy(_CircuitBreaker(fail_max=fail_max, reset_timeout=reset_timeout))
+    policy.next = _FakeNext(status_code)
+    return policy
+
+
+def test_opens_after_consecutive_failures_and_fails_fast(clock):
+    policy = _policy(429)
+    policy.send(None)
+    policy.send(None)
+
+    with pytest.raises(ServiceRequestError):
+        policy.send(None)
+    assert policy.next.calls == 2
+
+
+def test_success_resets_the_failure_count(clock):
+    policy = _policy(429)
+    policy.send(None)
+    policy.next.status_code = 200
+    policy.send(None)
+    policy.next.status_code = 429
+    policy.send(None)
+
+    # Only one failure since the success, so the circuit is still closed
+    policy.send(None)
+    assert policy.next.calls == 4
+
+
+def test_half_open_admits_a_single_probe_then_closes(clock):
+    policy = _policy(429)
+    policy.send(None)
+    policy.send(None)
+    clock.now += 31
+
+    policy.next.status_code = 200
+    policy.next.release.clear()
+    probe = threading.Thread(target=policy.send, args=(None,))
+    probe.start()
+    assert policy.next.entered.wait(timeout=5)
+
+    # Everyone else keeps failing fast while the probe is in flight
+    for _ in range(5):
+        with pytest.raises(ServiceRequestError):
+            policy.send(None)
+
+    policy.next.release.set()
+    probe.join(timeout=5)
+    assert policy.next.calls == 3
+
+    # The successful probe closed the circuit
+    policy.send(None)
+    assert policy.next.calls == 4
+
+
+def test_failed_probe_reopens_the_circuit(clock):
+    policy = _policy(503)
+    policy.send(None)
+    policy.send(None)
+    clock.now += 31
+
+    policy.send(None)
+    with pytest.raises(ServiceRequestError):
+        policy.send(None)
+
+    clock.now += 31
+    policy.next.status_code = 200
+    policy.send(None)
+    policy.send(None)
+    assert policy.next.calls == 5
+
+
+def test_aborted_probe_frees_the_probe_slot(clock):
+    policy = _policy(429)
+    policy.send(None)
+    policy.send(None)
+    clock.now += 31
+
+    policy.next = _RaisingNext()
+    with pytest.raises(RuntimeError):
+        policy.send(None)
+
+    policy.next = _FakeNext(200)
+    policy.send(None)
+    assert policy.next.calls == 1
+
+
+def _breaker_policy(client):
+    policies = client._client._pipeline._impl_policies
+    index = next(i for i, policy in enumerate(policies) if isinstance(policy, _CircuitBreakerPolicy))
+    return policies, index
+
+
+def test_each_client_pipeline_keeps_its_own_chain():
+    service = AzureService(get_settings())
+    resource_policies, resource_index = _breaker_policy(service.resource_client)
+    storage_policies, storage_index = _breaker_policy(service.storage_client)
+
+    resource_policy = resource_policies[resource_index]
+    storage_policy = storage_policies[storage_index]
+
+    assert resource_policy is not storage_policy
+    assert resource_policy.next is resource_policies[resource_index + 1]
+    assert storage_policy.next is storage_policies[storage_index + 1]
+    # Throttling seen by either client still opens the circuit for both
+    assert resource_policy.breaker is storage_policy.breaker
@@ -0,0 +1,41 @@
+import pytest
+from azure.core.exceptions import (
+    AzureError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceRequestTimeoutError,
+    ServiceResponseError,
+    ServiceResponseTimeoutError
+)
+
+from api.middleware.error_handler import _azure_error_status
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.reason = "reason"
+        self.headers = {}
+
+    def text(self, encoding=None):
+        return ""
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (ResourceNotFoundError("gone"), 404),
+        (ResourceExistsError("taken"), 409),
+        (ServiceRequestError("refused"), 503),
+        (ServiceRequestTimeoutError("slow"), 503),
+        (ServiceResponseError("reset"), 502),
+        (ServiceResponseTimeoutError("slow"), 504),
+        (HttpResponseError(response=_Response(400)), 400),
+        (AzureError("Something was not found"), 404),
+        (AzureError("boom"), 500),
+    ]
+)
+def test_azure_error_status(exc, expected):
+    assert _azure_error_status(exc) == expected
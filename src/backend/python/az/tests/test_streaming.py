@@ -0,0 +1,30 @@
+import asyncio
+import zlib
+
+from api.core.streaming import _gzip_chunks
+
+
+async def _pages(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _collect(chunks):
+    async def scenario():
+        return [chunk async for chunk in _gzip_chunks(chunks)]
+
+    return asyncio.run(scenario())
+
+
+def test_gzip_chunks_flushes_every_chunk():
+    compressed = _collect(_pages(b'{"a":1}\n', b'{"b":2}\n'))
+
+    # Each chunk decodes as soon as it arrives instead of waiting for the end of the stream
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(compressed[0]) == b'{"a":1}\n'
+    assert decompressor.decompress(compressed[1]) == b'{"b":2}\n'
+    assert zlib.decompress(b"".join(compressed), 16 + zlib.MAX_WBITS) == b'{"a":1}\n{"b":2}\n'
+
+
+def test_gzip_chunks_of_empty_stream_is_valid_gzip():
+    assert zlib.decompress(b"".join(_collect(_pages())), 16 + zlib.MAX_WBITS) == b""